@@ -3,7 +3,8 @@ PDF-to-Structured-Data API Package
 """
 
 from .main import app
-from .pdf_extractor import PDFExtractor, TableExporter
+from .cache import ExtractionCache
+from .pdf_extractor import PDFExtractor, PDFExtractionError, TableExporter
 from .models import (
     ExtractionOptions,
     ExtractionResponse,
@@ -11,6 +12,9 @@ from .models import (
     TableData,
     ImageInfo,
     PDFMetadata,
+    TextResponse,
+    TablesResponse,
+    MetadataResponse,
     ErrorResponse,
     HealthResponse
 )
@@ -18,7 +22,9 @@ from .models import (
 __version__ = "1.0.0"
 __all__ = [
     "app",
+    "ExtractionCache",
     "PDFExtractor",
+    "PDFExtractionError",
     "TableExporter",
     "ExtractionOptions",
     "ExtractionResponse",
@@ -26,6 +32,9 @@ __all__ = [
     "TableData",
     "ImageInfo",
     "PDFMetadata",
+    "TextResponse",
+    "TablesResponse",
+    "MetadataResponse",
     "ErrorResponse",
     "HealthResponse",
 ]
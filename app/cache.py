@@ -0,0 +1,62 @@
+"""
+In-process cache for extraction results
+"""
+
+from collections import OrderedDict
+from threading import Lock
+from typing import Optional
+import os
+
+from .models import ExtractionOptions, ExtractionResponse
+
+
+def default_cache_size() -> int:
+    """
+    Maximum number of cached extraction results.
+    Set PDF_EXTRACT_CACHE_SIZE=0 to disable caching.
+    """
+    configured = os.environ.get("PDF_EXTRACT_CACHE_SIZE")
+    if configured:
+        return max(0, int(configured))
+    return 64
+
+
+class ExtractionCache:
+    """
+    LRU cache of extraction responses keyed by the uploaded file's content
+    digest and the extraction options, so repeated uploads of the same
+    document skip parsing entirely.
+    """
+    
+    def __init__(self, max_entries: Optional[int] = None):
+        self.max_entries = default_cache_size() if max_entries is None else max_entries
+        self._entries: OrderedDict[tuple[str, str], ExtractionResponse] = OrderedDict()
+        self._lock = Lock()
+    
+    @staticmethod
+    def make_key(digest: str, options: ExtractionOptions) -> tuple[str, str]:
+        """Build a cache key; worker count doesn't affect the result, so it is left out."""
+        return digest, options.model_dump_json(exclude={"max_workers"})
+    
+    def get(self, key: tuple[str, str]) -> Optional[ExtractionResponse]:
+        """Return the cached response for key, marking it as recently used."""
+        with self._lock:
+            response = self._entries.get(key)
+            if response is not None:
+                self._entries.move_to_end(key)
+            return response
+    
+    def put(self, key: tuple[str, str], response: ExtractionResponse) -> None:
+        """Store a response, evicting the least recently used entry when full."""
+        if self.max_entries <= 0:
+            return
+        
+        with self._lock:
+            self._entries[key] = response
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
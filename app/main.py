@@ -3,21 +3,38 @@ PDF-to-Structured-Data API
 Extracts text, tables, metadata, and structured information from PDF files.
 """
 
-from fastapi import FastAPI, UploadFile, File, HTTPException, Query
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Depends, Request
 from fastapi.responses import JSONResponse
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from typing import Optional
+from typing import AsyncIterator, Callable, NamedTuple, Optional
+import hashlib
 import tempfile
 import os
+import re
 
-from .pdf_extractor import PDFExtractor
+from .cache import ExtractionCache
+from .pdf_extractor import PDFExtractor, PDFExtractionError, TEXT_BACKENDS, WORD_COUNTERS
 from .models import (
     ExtractionResponse,
     ExtractionOptions,
+    TextResponse,
+    TablesResponse,
+    MetadataResponse,
     ErrorResponse,
     HealthResponse
 )
 
+# Page selections: "3", "2-7", and comma-separated lists of those
+_PAGE_SPEC_RE = re.compile(r'\d+(?:-\d+)?(?:,\d+(?:-\d+)?)*')
+_PAGES_RE = re.compile(r'(\d+)(?:-(\d+))?')
+
+# Uploads are streamed to disk in chunks of this size
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Results of /extract, keyed by upload content digest and options
+extraction_cache = ExtractionCache()
+
 app = FastAPI(
     title="PDF-to-Structured-Data API",
     description="Extract text, tables, metadata, and structured data from PDF files",
@@ -56,35 +73,94 @@ async def health_check():
     )
 
 
-@app.post("/extract", response_model=ExtractionResponse)
-async def extract_pdf(
-    file: UploadFile = File(..., description="PDF file to process"),
-    extract_text: bool = Query(True, description="Extract text content"),
-    extract_tables: bool = Query(True, description="Extract tables as structured data"),
-    extract_metadata: bool = Query(True, description="Extract PDF metadata"),
-    extract_images: bool = Query(False, description="Extract image information"),
-    page_numbers: Optional[str] = Query(None, description="Specific pages to extract (e.g., '1,2,5-10')"),
-    output_format: str = Query("json", description="Output format: json, markdown, or csv")
-):
+@app.exception_handler(PDFExtractionError)
+async def pdf_extraction_error_handler(request: Request, exc: PDFExtractionError):
+    """Report extraction failures from any endpoint in the ErrorResponse format"""
+    return JSONResponse(
+        status_code=500,
+        content=ErrorResponse(error="Error processing PDF", detail=str(exc)).model_dump()
+    )
+
+
+class StagedUpload(NamedTuple):
+    """An uploaded PDF written to a temporary file"""
+    path: str
+    size: int
+    digest: str
+
+
+async def staged_pdf(
+    file: UploadFile = File(..., description="PDF file to process")
+) -> AsyncIterator[StagedUpload]:
     """
-    Extract structured data from a PDF file.
-    
-    - **file**: The PDF file to process
-    - **extract_text**: Whether to extract text content (default: True)
-    - **extract_tables**: Whether to extract tables (default: True)
-    - **extract_metadata**: Whether to extract PDF metadata (default: True)
-    - **extract_images**: Whether to extract image information (default: False)
-    - **page_numbers**: Specific pages to process (e.g., "1,2,5-10")
-    - **output_format**: Output format - json, markdown, or csv
+    Dependency that validates the upload, stages it to a temporary file and
+    removes the file once the request is done.
     """
-    
-    # Validate file type
     if not file.filename.lower().endswith('.pdf'):
         raise HTTPException(
             status_code=400,
             detail="Invalid file type. Only PDF files are accepted."
         )
     
+    upload = StagedUpload(*await _stage_upload(file))
+    try:
+        yield upload
+    finally:
+        if os.path.exists(upload.path):
+            os.unlink(upload.path)
+
+
+def page_selection(
+    page_numbers: Optional[str] = Query(None, description="Specific pages to extract (e.g., '1,2,5-10')")
+) -> Optional[list[int]]:
+    """Parse the page_numbers query parameter, rejecting malformed values with a 400."""
+    if not page_numbers:
+        return None
+    
+    try:
+        return parse_page_numbers(page_numbers)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+def text_backend(
+    backend: str = Query("pymupdf", description="Text backend: pymupdf, pypdfium, or pdfplumber")
+) -> str:
+    """Reject unknown text backends with a 400."""
+    if backend not in TEXT_BACKENDS:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid backend. Use 'pymupdf', 'pypdfium', or 'pdfplumber'."
+        )
+    return backend
+
+
+def word_counter_choice(
+    word_counter: str = Query("regex", description="Word counting: regex or plumber_words")
+) -> str:
+    """Reject unknown word counters with a 400."""
+    if word_counter not in WORD_COUNTERS:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid word_counter. Use 'regex' or 'plumber_words'."
+        )
+    return word_counter
+
+
+def extraction_options(
+    extract_text: bool = Query(True, description="Extract text content"),
+    extract_tables: bool = Query(True, description="Extract tables as structured data"),
+    extract_metadata: bool = Query(True, description="Extract PDF metadata"),
+    extract_images: bool = Query(False, description="Extract image information"),
+    pages: Optional[list[int]] = Depends(page_selection),
+    output_format: str = Query("json", description="Output format: json, markdown, or csv"),
+    include_full_text: bool = Query(True, description="Include the concatenated full_text field"),
+    backend: str = Depends(text_backend),
+    force_pattern_tables: bool = Query(False, description="Run borderless-table patterns even when bordered tables are found"),
+    word_counter: str = Depends(word_counter_choice)
+) -> ExtractionOptions:
+    """Validate the /extract query parameters and build the extraction options."""
+    
     # Validate output format
     if output_format not in ["json", "markdown", "csv"]:
         raise HTTPException(
@@ -92,132 +168,135 @@ async def extract_pdf(
             detail="Invalid output format. Use 'json', 'markdown', or 'csv'."
         )
     
-    # Parse page numbers if provided
-    pages_to_extract = None
-    if page_numbers:
-        try:
-            pages_to_extract = parse_page_numbers(page_numbers)
-        except ValueError as e:
-            raise HTTPException(status_code=400, detail=str(e))
-    
-    # Create extraction options
-    options = ExtractionOptions(
+    return ExtractionOptions(
         extract_text=extract_text,
         extract_tables=extract_tables,
         extract_metadata=extract_metadata,
         extract_images=extract_images,
-        pages=pages_to_extract,
-        output_format=output_format
+        pages=pages,
+        output_format=output_format,
+        include_full_text=include_full_text,
+        backend=backend,
+        force_pattern_tables=force_pattern_tables,
+        word_counter=word_counter
     )
+
+
+# Query-parameter dependencies are declared ahead of staged_pdf in every endpoint,
+# so a bad parameter is rejected before the upload is written to disk and hashed
+
+@app.post("/extract", response_model=ExtractionResponse)
+async def extract_pdf(
+    options: ExtractionOptions = Depends(extraction_options),
+    upload: StagedUpload = Depends(staged_pdf)
+):
+    """
+    Extract structured data from a PDF file.
     
-    # Save uploaded file temporarily
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-        
-        # Process the PDF
-        extractor = PDFExtractor(tmp_path)
-        result = extractor.extract(options)
-        
-        return result
-        
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error processing PDF: {str(e)}"
-        )
-    finally:
-        # Clean up temporary file
-        if 'tmp_path' in locals() and os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+    - **file**: The PDF file to process
+    - **extract_text**: Whether to extract text content (default: True)
+    - **extract_tables**: Whether to extract tables (default: True)
+    - **extract_metadata**: Whether to extract PDF metadata (default: True)
+    - **extract_images**: Whether to extract image information (default: False)
+    - **page_numbers**: Specific pages to process (e.g., "1,2,5-10")
+    - **output_format**: Output format - json, markdown, or csv
+    - **include_full_text**: Whether to include the concatenated full_text (default: True)
+    - **backend**: Text extraction backend - pymupdf, pypdfium, or pdfplumber.
+      pdfplumber is used when tables are extracted or the backend isn't installed.
+      With pymupdf, image information is read with PyMuPDF as well.
+    - **force_pattern_tables**: Also run pattern-based (borderless) table detection when
+      bordered tables are found (default: False)
+    - **word_counter**: How words are counted - regex (whitespace-separated, default)
+      or plumber_words (pdfplumber's extract_words, slower)
+    """
+    
+    cache_key = extraction_cache.make_key(upload.digest, options)
+    cached = extraction_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    result = await _run_extractor(upload, PDFExtractor.extract, options)
+    
+    extraction_cache.put(cache_key, result)
+    return result
 
 
-@app.post("/extract/text")
+@app.post("/extract/text", response_model=TextResponse)
 async def extract_text_only(
-    file: UploadFile = File(...),
-    page_numbers: Optional[str] = Query(None)
+    pages: Optional[list[int]] = Depends(page_selection),
+    backend: str = Depends(text_backend),
+    word_counter: str = Depends(word_counter_choice),
+    upload: StagedUpload = Depends(staged_pdf)
 ):
     """Extract only text content from a PDF file."""
     
-    if not file.filename.lower().endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="Invalid file type")
-    
-    pages = parse_page_numbers(page_numbers) if page_numbers else None
-    
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-        
-        extractor = PDFExtractor(tmp_path)
-        text_data = extractor.extract_text(pages)
-        
-        return {"text": text_data}
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if 'tmp_path' in locals() and os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+    text_data = await _run_extractor(
+        upload, PDFExtractor.extract_text, pages, None, backend, word_counter
+    )
+    return TextResponse(text=text_data)
 
 
-@app.post("/extract/tables")
+@app.post("/extract/tables", response_model=TablesResponse)
 async def extract_tables_only(
-    file: UploadFile = File(...),
-    page_numbers: Optional[str] = Query(None),
-    output_format: str = Query("json", description="Output: json, csv, or excel")
+    pages: Optional[list[int]] = Depends(page_selection),
+    output_format: str = Query("json", description="Output: json, csv, or excel"),
+    force_pattern_tables: bool = Query(False, description="Run borderless-table patterns even when bordered tables are found"),
+    upload: StagedUpload = Depends(staged_pdf)
 ):
     """Extract only tables from a PDF file."""
     
-    if not file.filename.lower().endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="Invalid file type")
-    
-    pages = parse_page_numbers(page_numbers) if page_numbers else None
-    
-    try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-        
-        extractor = PDFExtractor(tmp_path)
-        tables_data = extractor.extract_tables(pages, output_format)
-        
-        return {"tables": tables_data}
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if 'tmp_path' in locals() and os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+    tables_data = await _run_extractor(
+        upload, PDFExtractor.extract_tables, pages, output_format, None, force_pattern_tables
+    )
+    return TablesResponse(tables=tables_data)
 
 
-@app.post("/extract/metadata")
-async def extract_metadata_only(file: UploadFile = File(...)):
+@app.post("/extract/metadata", response_model=MetadataResponse)
+async def extract_metadata_only(upload: StagedUpload = Depends(staged_pdf)):
     """Extract only metadata from a PDF file."""
     
-    if not file.filename.lower().endswith('.pdf'):
-        raise HTTPException(status_code=400, detail="Invalid file type")
+    metadata = await _run_extractor(upload, PDFExtractor.extract_metadata)
+    return MetadataResponse(metadata=metadata)
+
+
+async def _run_extractor(upload: StagedUpload, method: Callable, *args):
+    """
+    Run a PDFExtractor method on a staged upload in a worker thread, so
+    parsing doesn't block the event loop. Failures are re-raised as
+    PDFExtractionError for the shared exception handler.
+    """
+    def run():
+        with PDFExtractor(upload.path, file_size=upload.size) as extractor:
+            return method(extractor, *args)
     
     try:
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
-            content = await file.read()
-            tmp_file.write(content)
-            tmp_path = tmp_file.name
-        
-        extractor = PDFExtractor(tmp_path)
-        metadata = extractor.extract_metadata()
-        
-        return {"metadata": metadata}
-        
+        return await run_in_threadpool(run)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        if 'tmp_path' in locals() and os.path.exists(tmp_path):
-            os.unlink(tmp_path)
+        raise PDFExtractionError(str(e)) from e
+
+
+async def _stage_upload(file: UploadFile) -> tuple[str, int, str]:
+    """
+    Stream an uploaded file into a temporary PDF in fixed-size chunks, so
+    memory use stays bounded regardless of the upload size. The size and
+    content digest are computed in the same pass.
+    Returns (temporary file path, size in bytes, hex digest); the staged_pdf
+    dependency removes the file when the request is done.
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    size = 0
+    
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as tmp_file:
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                hasher.update(chunk)
+                size += len(chunk)
+                tmp_file.write(chunk)
+        except Exception:
+            tmp_file.close()
+            os.unlink(tmp_file.name)
+            raise
+        return tmp_file.name, size, hasher.hexdigest()
 
 
 def parse_page_numbers(page_str: str) -> list[int]:
@@ -225,23 +304,22 @@ def parse_page_numbers(page_str: str) -> list[int]:
     Parse page number string into a list of page numbers.
     Supports formats: "1,2,3" or "1-5" or "1,3,5-10"
     """
-    pages = set()
-    parts = page_str.replace(" ", "").split(",")
-    
-    for part in parts:
-        if "-" in part:
-            try:
-                start, end = part.split("-")
-                start, end = int(start), int(end)
-                if start > end:
-                    raise ValueError(f"Invalid range: {part}")
-                pages.update(range(start, end + 1))
-            except ValueError:
-                raise ValueError(f"Invalid page range: {part}")
-        else:
-            try:
-                pages.add(int(part))
-            except ValueError:
-                raise ValueError(f"Invalid page number: {part}")
-    
-    return sorted(list(pages))
+    spec = page_str.replace(" ", "")
+    
+    if not _PAGE_SPEC_RE.fullmatch(spec):
+        bad = next((p for p in spec.split(",") if not _PAGES_RE.fullmatch(p)), spec)
+        raise ValueError(f"Invalid page number or range: {bad}")
+    
+    pages = []
+    for match in _PAGES_RE.finditer(spec):
+        start, end = match.groups()
+        if end is None:
+            pages.append(int(start))
+            continue
+        
+        start, end = int(start), int(end)
+        if start > end:
+            raise ValueError(f"Invalid page range: {match.group(0)}")
+        pages.extend(range(start, end + 1))
+    
+    return sorted(set(pages))
@@ -4,7 +4,37 @@ Pydantic models for the PDF-to-Structured-Data API
 
 from pydantic import BaseModel, Field
 from typing import Optional, Any
-from datetime import datetime
+from datetime import datetime, timezone
+import os
+
+
+def default_max_workers() -> int:
+    """
+    Number of workers used for per-page extraction.
+    Pages are processed serially unless PDF_EXTRACT_MAX_WORKERS is set above 1:
+    every worker re-opens and re-parses the document, and pdfminer's pure-Python
+    layout analysis gains little from threads, so pooling is opt-in (best with
+    PDF_EXTRACT_EXECUTOR=process).
+    """
+    configured = os.environ.get("PDF_EXTRACT_MAX_WORKERS")
+    if configured:
+        return max(1, int(configured))
+    return 1
+
+
+def default_executor() -> str:
+    """
+    Pool used for parallel page processing: "thread" (default) or "process".
+    pdfminer is pure Python, so a process pool scales better on CPU-bound
+    documents at the cost of starting worker processes per request.
+    Configured with PDF_EXTRACT_EXECUTOR.
+    """
+    return "process" if os.environ.get("PDF_EXTRACT_EXECUTOR") == "process" else "thread"
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with second precision."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds")
 
 
 class ExtractionOptions(BaseModel):
@@ -15,6 +45,12 @@ class ExtractionOptions(BaseModel):
     extract_images: bool = False
     pages: Optional[list[int]] = None
     output_format: str = "json"
+    include_full_text: bool = True
+    backend: str = "pymupdf"
+    force_pattern_tables: bool = False
+    word_counter: str = "regex"
+    max_workers: int = Field(default_factory=default_max_workers, ge=1)
+    executor: str = Field(default_factory=default_executor)
 
 
 class PageText(BaseModel):
@@ -23,6 +59,9 @@ class PageText(BaseModel):
     text: str
     char_count: int
     word_count: int
+    
+    class Config:
+        frozen = True
 
 
 class TableData(BaseModel):
@@ -33,6 +72,11 @@ class TableData(BaseModel):
     rows: list[list[Any]]
     row_count: int
     column_count: int
+    # Normalized first-row text for duplicate detection, set when the table is built
+    first_row_sig: Optional[str] = Field(default=None, exclude=True)
+    
+    class Config:
+        frozen = True
 
 
 class ImageInfo(BaseModel):
@@ -43,6 +87,9 @@ class ImageInfo(BaseModel):
     height: int
     color_space: Optional[str] = None
     bits_per_component: Optional[int] = None
+    
+    class Config:
+        frozen = True
 
 
 class PDFMetadata(BaseModel):
@@ -64,7 +111,7 @@ class ExtractionResponse(BaseModel):
     """Complete extraction response"""
     success: bool = True
     filename: Optional[str] = None
-    extraction_timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    extraction_timestamp: str = Field(default_factory=utc_timestamp)
     metadata: Optional[PDFMetadata] = None
     text: Optional[list[PageText]] = None
     full_text: Optional[str] = None
@@ -77,7 +124,7 @@ class ExtractionResponse(BaseModel):
             "example": {
                 "success": True,
                 "filename": "document.pdf",
-                "extraction_timestamp": "2024-01-15T10:30:00",
+                "extraction_timestamp": "2024-01-15T10:30:00+00:00",
                 "metadata": {
                     "title": "Sample Document",
                     "author": "John Doe",
@@ -105,6 +152,21 @@ class ExtractionResponse(BaseModel):
         }
 
 
+class TextResponse(BaseModel):
+    """Text-only extraction response"""
+    text: list[PageText]
+
+
+class TablesResponse(BaseModel):
+    """Tables-only extraction response"""
+    tables: list[TableData]
+
+
+class MetadataResponse(BaseModel):
+    """Metadata-only extraction response"""
+    metadata: PDFMetadata
+
+
 class ErrorResponse(BaseModel):
     """Error response model"""
     success: bool = False
@@ -3,24 +3,102 @@ PDF Extractor - Final version with improved table detection
 Handles both bordered tables and borderless tables in academic papers.
 """
 
+import csv
+import gc
+import io
 import os
-from typing import Optional, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property
+from itertools import repeat
+from typing import TYPE_CHECKING, Iterator, Optional, Any
 from datetime import datetime
 
-import pdfplumber
-from pypdf import PdfReader
-import pandas as pd
 import re
 
+if TYPE_CHECKING:
+    # pandas is only needed for DataFrame/Markdown export and is imported lazily there.
+    # pdfplumber and pypdf are imported where a document is first opened, so requests
+    # served entirely by PyMuPDF never pay for loading them
+    import pandas as pd
+    import pdfplumber
+    from pypdf import PdfReader
+
+try:
+    # Optional: PyMuPDF reads the trailer and Info dictionary without
+    # building pypdf's object tree, and its C text extractor is much faster
+    # than pdfminer's pure-Python layout analysis
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+try:
+    # Optional: PDFium-based text extraction
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
 from .models import (
     ExtractionOptions,
     ExtractionResponse,
     PageText,
     TableData,
     ImageInfo,
-    PDFMetadata
+    PDFMetadata,
+    default_executor,
+    default_max_workers
 )
 
+# Numeric table cell such as "42", "-3.5", "1,200", "$99", "12%" or "2.5e-4":
+# thousands separators and currency/percent signs are removed in one translate()
+# call, then the remainder must be a decimal number with an optional exponent
+_NUM_STRIP = str.maketrans("", "", ",$%")
+_NUM_RE = re.compile(r'^[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?$')
+
+# Text extraction backends; pdfplumber is always available and also used
+# whenever tables are extracted, since table detection needs its page objects
+TEXT_BACKENDS = ("pymupdf", "pypdfium", "pdfplumber")
+
+# Word counting: "regex" counts whitespace-separated runs in the page text (as
+# str.split() would); "plumber_words" counts pdfplumber's extract_words(), which
+# groups characters by position and needs an extra layout pass over every page
+WORD_COUNTERS = ("regex", "plumber_words")
+
+# Force a garbage collection after this many pdfplumber pages, so the
+# reference cycles left by pdfminer's layout objects are reclaimed on long runs
+GC_INTERVAL_PAGES = 100
+
+# A word is any run of non-whitespace characters, as with str.split()
+_WORD_RE = re.compile(r'\S+')
+
+# Whitespace runs collapsed when cleaning table cells
+_WS_RE = re.compile(r'\s+')
+
+# Pattern-based (borderless) table rows, see _extract_pattern_tables
+# Pattern 1: label + P/R/F1 scores, e.g. "P1411 0.99 1 1"
+_LABEL_SCORE_RE = re.compile(
+    r'^([A-Za-z]\d+|[A-Za-z_]+avg)\s+([\d\.]+)\s+([\d\.]+)\s+([\d\.]+)\s*$',
+    re.MULTILINE
+)
+# Pattern 2: feature combination results, e.g. "F1 Train 0.91 0.92 0.93"
+_FEATURE_RE = re.compile(
+    r'(F[1-4])\s*(Train|Test)\s*([\d\.]+)\s*([\d\.]+)\s*([\d\.]+)',
+    re.MULTILINE
+)
+# Pattern 3: model comparison, e.g. "BERT 0.8 0.85 0.82"
+_MODEL_RE = re.compile(
+    r'^(SVM|BERT|ERNIE(?:\([^)]+\))?)\s+([\d\.]+)\s+([\d\.]+)\s+([\d\.]+)\s*$',
+    re.MULTILINE
+)
+# Pattern 4: numbered key-value pairs, e.g. "1 Learning rate 0.001"
+_KV_RE = re.compile(
+    r'^(\d+)\s+([A-Za-z]+(?:\s+[A-Za-z]+)?)\s+(.+)$',
+    re.MULTILINE
+)
+
+
+class PDFExtractionError(Exception):
+    """Raised when a PDF cannot be processed."""
+
 
 class PDFExtractor:
     """
@@ -29,34 +107,332 @@ class PDFExtractor:
     extraction for borderless tables common in academic papers.
     """
     
-    def __init__(self, file_path: str):
+    def __init__(self, file_path: str, file_size: Optional[int] = None):
         self.file_path = file_path
-        self.file_size = os.path.getsize(file_path)
+        # Callers that staged the file themselves already know its size
+        self.file_size = os.path.getsize(file_path) if file_size is None else file_size
+        # pdfplumber page text by page number; layout analysis is the expensive part
+        self._page_text_cache: dict[int, str] = {}
+        self._pages_scanned = 0
+        # pdfplumber handle and the page selection it was opened with (None = all pages)
+        self._plumber: Optional["pdfplumber.PDF"] = None
+        self._plumber_pages: Optional[frozenset[int]] = None
+    
+    def __enter__(self) -> "PDFExtractor":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Release the underlying PDF handles that have been opened."""
+        if self._plumber is not None:
+            self._plumber.close()
+            self._plumber = None
+        mupdf = self.__dict__.pop("_mupdf", None)
+        if mupdf is not None:
+            mupdf.close()
+        self.__dict__.pop("_reader", None)
+    
+    def _open_plumber(self, pages: Optional[list[int]] = None) -> "pdfplumber.PDF":
+        """
+        pdfplumber document restricted to the selected pages, so pages outside the
+        selection never get a Page object. The handle is shared by later calls and
+        only reopened when they ask for pages it doesn't cover.
+        """
+        selection = frozenset(pages) if pages else None
+        covered = self._plumber is not None and (
+            self._plumber_pages is None
+            or (selection is not None and selection <= self._plumber_pages)
+        )
+        
+        if not covered:
+            import pdfplumber
+            
+            if self._plumber is not None:
+                self._plumber.close()
+            self._plumber = pdfplumber.open(
+                self.file_path, pages=sorted(selection) if selection else None
+            )
+            self._plumber_pages = selection
+        
+        return self._plumber
+    
+    @cached_property
+    def _reader(self) -> "PdfReader":
+        """pypdf reader, opened on first use and shared by metadata and image extraction."""
+        from pypdf import PdfReader
+        
+        return PdfReader(self.file_path)
+    
+    @cached_property
+    def _mupdf(self) -> "pymupdf.Document":
+        """PyMuPDF document, opened on first use and shared by metadata and text extraction."""
+        return pymupdf.open(self.file_path)
+    
+    def _iter_pages(self, pages: Optional[list[int]] = None):
+        """Yield (page_number, page) pairs for the selected pdfplumber pages."""
+        selection = frozenset(pages) if pages else None
+        
+        # The handle may cover a wider selection opened by an earlier call
+        for page in self._open_plumber(pages).pages:
+            if selection is None or page.page_number in selection:
+                yield page.page_number, page
+    
+    def _select_pages(self, page_count: int, pages: Optional[list[int]] = None) -> list[int]:
+        """Page numbers (1-based) to process, in document order."""
+        if not pages:
+            return list(range(1, page_count + 1))
+        
+        # Deduplicate once and drop pages past the end of the document
+        return sorted(n for n in frozenset(pages) if 1 <= n <= page_count)
+    
+    def _scan_pages(
+        self,
+        pages: Optional[list[int]] = None,
+        extract_tables: bool = False,
+        max_workers: int = 1,
+        backend: str = "pdfplumber",
+        executor: str = "thread"
+    ) -> list[tuple[int, str, list[TableData]]]:
+        """Collect (page_number, text, bordered_tables) for the selected pages, in page order."""
+        return list(self._iter_scan_pages(pages, extract_tables, max_workers, backend, executor))
+    
+    def _iter_scan_pages(
+        self,
+        pages: Optional[list[int]] = None,
+        extract_tables: bool = False,
+        max_workers: int = 1,
+        backend: str = "pdfplumber",
+        executor: str = "thread"
+    ) -> Iterator[tuple[int, str, list[TableData]]]:
+        """
+        Yield (page_number, text, bordered_tables) for the selected pages, in page order.
+        
+        Text-only scans use the requested fast backend when it is installed.
+        Otherwise pages go through pdfplumber; with max_workers > 1 they are split
+        into contiguous chunks that are processed in worker threads, or in worker
+        processes when executor is "process". pdfplumber documents can't be shared
+        between workers, so every worker opens its own handle restricted to its chunk.
+        """
+        if not extract_tables:
+            if backend == "pymupdf" and pymupdf is not None:
+                yield from ((n, text, []) for n, text in self._extract_text_pymupdf(pages))
+                return
+            if backend == "pypdfium" and pdfium is not None:
+                yield from ((n, text, []) for n, text in self._extract_text_pypdfium(pages))
+                return
+        
+        if max_workers > 1:
+            # Workers open their own handles, so count pages without opening pdfplumber here
+            page_nums = self._select_pages(self._page_count(), pages)
+            if min(max_workers, len(page_nums)) > 1:
+                yield from self._iter_scan_pages_pooled(page_nums, extract_tables, max_workers, executor)
+                return
+        
+        table_index = 0
+        for page_num, page in self._iter_pages(pages):
+            page_num, text, page_tables = self._scan_page(page, page_num, extract_tables)
+            page_tables = self._number_tables(page_tables, table_index)
+            table_index += len(page_tables)
+            yield page_num, text, page_tables
+    
+    def _iter_scan_pages_pooled(
+        self,
+        page_nums: list[int],
+        extract_tables: bool,
+        max_workers: int,
+        executor: str
+    ) -> Iterator[tuple[int, str, list[TableData]]]:
+        """
+        Scan pages in a worker pool, yielding results in page order.
+        Text already in _page_text_cache is reused: text-only scans don't send
+        those pages to the workers at all, and table scans pass the text along
+        so workers only run table detection on them.
+        """
+        cache = self._page_text_cache
+        pending = page_nums if extract_tables else [n for n in page_nums if n not in cache]
+        table_index = 0
+        
+        if not pending:
+            for page_num in page_nums:
+                yield page_num, cache[page_num], []
+            return
+        
+        workers = min(max_workers, len(pending))
+        chunk_size = -(-len(pending) // workers)
+        chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+        chunk_texts = [{n: cache[n] for n in chunk if n in cache} for chunk in chunks]
+        pending_set = frozenset(pending)
+        
+        pool_class = ProcessPoolExecutor if executor == "process" else ThreadPoolExecutor
+        
+        with pool_class(max_workers=len(chunks)) as ex:
+            # ex.map preserves chunk order, so scanned pages come back sorted by page
+            scanned = (
+                result
+                for chunk in ex.map(
+                    _scan_page_chunk, repeat(self.file_path), chunks,
+                    repeat(extract_tables), chunk_texts
+                )
+                for result in chunk
+            )
+            
+            # Merge scanned pages with cached ones, in page order
+            for page_num in page_nums:
+                if page_num in pending_set:
+                    _, text, page_tables = next(scanned)
+                    cache[page_num] = text
+                    page_tables = self._number_tables(page_tables, table_index)
+                    table_index += len(page_tables)
+                else:
+                    text, page_tables = cache[page_num], []
+                yield page_num, text, page_tables
+    
+    def _page_count(self) -> int:
+        """Number of pages in the document, read with PyMuPDF when installed, otherwise pypdf."""
+        if pymupdf is not None:
+            return self._mupdf.page_count
+        return len(self._reader.pages)
+    
+    def _number_tables(self, page_tables: list[TableData], start: int) -> list[TableData]:
+        """A page's tables numbered in document order from start (tables are immutable, so copied)."""
+        return [
+            table if table.table_index == start + i
+            else table.model_copy(update={"table_index": start + i})
+            for i, table in enumerate(page_tables)
+        ]
+    
+    def _extract_text_pymupdf(self, pages: Optional[list[int]] = None) -> list[tuple[int, str]]:
+        """Extract (page_number, text) pairs with PyMuPDF."""
+        doc = self._mupdf
+        
+        # Trailing newlines are dropped to match pdfplumber's output
+        return [
+            (n, doc.load_page(n - 1).get_text("text").rstrip("\n"))
+            for n in self._select_pages(doc.page_count, pages)
+        ]
+    
+    def _extract_text_pypdfium(self, pages: Optional[list[int]] = None) -> list[tuple[int, str]]:
+        """Extract (page_number, text) pairs with pypdfium2."""
+        results = []
+        doc = pdfium.PdfDocument(self.file_path)
+        
+        try:
+            for n in self._select_pages(len(doc), pages):
+                page = doc[n - 1]
+                textpage = page.get_textpage()
+                text = textpage.get_text_range().replace("\r\n", "\n").rstrip("\n")
+                results.append((n, text))
+                textpage.close()
+                page.close()
+        finally:
+            doc.close()
+        
+        return results
+    
+    def _scan_page(
+        self,
+        page,
+        page_num: int,
+        extract_tables: bool
+    ) -> tuple[int, str, list[TableData]]:
+        """Extract text and, optionally, bordered tables from a single page."""
+        try:
+            text = self._get_page_text(page, page_num)
+            page_tables = self._extract_bordered_tables(page, page_num) if extract_tables else []
+        finally:
+            # Drop the page's cached layout objects; pdfminer otherwise keeps
+            # every scanned page alive for the lifetime of the document
+            page.close()
+            self._pages_scanned += 1
+            if self._pages_scanned % GC_INTERVAL_PAGES == 0:
+                gc.collect()
+        
+        return page_num, text, page_tables
+    
+    def _get_page_text(self, page, page_num: int) -> str:
+        """pdfplumber text for a page, extracted at most once per extractor."""
+        text = self._page_text_cache.get(page_num)
+        if text is None:
+            text = page.extract_text() or ""
+            self._page_text_cache[page_num] = text
+        return text
         
     def extract(self, options: ExtractionOptions) -> ExtractionResponse:
-        """Main extraction method."""
+        """
+        Main extraction method.
+        Text and tables are collected in a single pass over the pages of an
+        already-open document. When tables are requested, text comes from the
+        same pdfplumber pass; otherwise options.backend is used for text.
+        Metadata and image info never go through pdfplumber, so requests for
+        only those don't open it or run any layout analysis.
+        """
+        # extraction_timestamp is stamped once here and reused by the statistics
         response = ExtractionResponse(
             success=True,
-            filename=os.path.basename(self.file_path),
-            extraction_timestamp=datetime.utcnow().isoformat()
+            filename=os.path.basename(self.file_path)
         )
         
         try:
             if options.extract_metadata:
                 response.metadata = self.extract_metadata()
             
-            if options.extract_text:
-                text_data = self.extract_text(options.pages)
-                response.text = text_data
-                response.full_text = "\n\n".join([p.text for p in text_data])
+            text_stats = None
             
-            if options.extract_tables:
-                response.tables = self.extract_tables(options.pages, options.output_format)
+            # The only path that can open pdfplumber (see _scan_pages)
+            if options.extract_text or options.extract_tables:
+                text_data = []
+                text_parts = []
+                total_chars = 0
+                total_words = 0
+                tables_results = []
+                
+                for page_num, text, page_tables in self._scan_pages(
+                    options.pages,
+                    options.extract_tables,
+                    options.max_workers,
+                    options.backend,
+                    options.executor
+                ):
+                    text_parts.append(text)
+                    
+                    if options.extract_text:
+                        page_text = self._build_page_text(page_num, text)
+                        text_data.append(page_text)
+                        total_chars += page_text.char_count
+                        total_words += page_text.word_count
+                    
+                    if options.extract_tables:
+                        tables_results.extend(page_tables)
+                
+                if options.extract_text:
+                    if options.word_counter == "plumber_words":
+                        total_words = self._apply_plumber_word_counts(text_data, options.pages)
+                    response.text = text_data
+                    if options.include_full_text:
+                        response.full_text = "\n\n".join(text_parts)
+                    if text_data:
+                        text_stats = {
+                            "total_pages_extracted": len(text_data),
+                            "total_characters": total_chars,
+                            "total_words": total_words,
+                        }
+                
+                if options.extract_tables:
+                    # Pattern-based tables are a fallback for documents without bordered ones
+                    if not tables_results or options.force_pattern_tables:
+                        # Tables force the pdfplumber pass, so full_text (when built) is the same text
+                        full_text = response.full_text
+                        if full_text is None:
+                            full_text = "\n\n".join(text_parts)
+                        tables_results = self._merge_pattern_tables(tables_results, full_text)
+                    response.tables = tables_results
             
             if options.extract_images:
-                response.images = self.extract_image_info(options.pages)
+                response.images = self.extract_image_info(options.pages, options.backend)
             
-            response.statistics = self._compute_statistics(response)
+            response.statistics = self._compute_statistics(response, text_stats)
             return response
             
         except Exception as e:
@@ -64,8 +440,11 @@ class PDFExtractor:
             raise e
     
     def extract_metadata(self) -> PDFMetadata:
-        """Extract PDF metadata using pypdf."""
-        reader = PdfReader(self.file_path)
+        """Extract PDF metadata using PyMuPDF when available, otherwise pypdf."""
+        if pymupdf is not None:
+            return self._extract_metadata_pymupdf()
+        
+        reader = self._reader
         meta = reader.metadata or {}
         
         creation_date = None
@@ -90,99 +469,212 @@ class PDFExtractor:
             pdf_version=reader.pdf_header if hasattr(reader, 'pdf_header') else None
         )
     
-    def extract_text(self, pages: Optional[list[int]] = None) -> list[PageText]:
-        """Extract text from PDF pages."""
-        text_results = []
+    def _extract_metadata_pymupdf(self) -> PDFMetadata:
+        """Extract PDF metadata using PyMuPDF."""
+        doc = self._mupdf
+        meta = doc.metadata or {}
+        page_count = doc.page_count
+        is_encrypted = doc.is_encrypted or bool(meta.get("encryption"))
         
-        with pdfplumber.open(self.file_path) as pdf:
-            for i, page in enumerate(pdf.pages):
-                page_num = i + 1
-                
-                if pages and page_num not in pages:
-                    continue
-                
-                text = page.extract_text() or ""
-                
-                text_results.append(PageText(
-                    page_number=page_num,
-                    text=text,
-                    char_count=len(text),
-                    word_count=len(text.split()) if text else 0
-                ))
+        creation_date = None
+        mod_date = None
+        
+        if meta.get("creationDate"):
+            creation_date = self._parse_pdf_date(meta["creationDate"])
+        if meta.get("modDate"):
+            mod_date = self._parse_pdf_date(meta["modDate"])
+        
+        # PyMuPDF reports "PDF 1.7"; keep the "%PDF-1.7" header form used by pypdf
+        pdf_format = meta.get("format")
+        
+        return PDFMetadata(
+            title=meta.get("title") or None,
+            author=meta.get("author") or None,
+            subject=meta.get("subject") or None,
+            creator=meta.get("creator") or None,
+            producer=meta.get("producer") or None,
+            creation_date=creation_date,
+            modification_date=mod_date,
+            page_count=page_count,
+            file_size_bytes=self.file_size,
+            is_encrypted=is_encrypted,
+            pdf_version="%" + pdf_format.replace(" ", "-") if pdf_format else None
+        )
+    
+    def extract_text(
+        self,
+        pages: Optional[list[int]] = None,
+        max_workers: Optional[int] = None,
+        backend: str = "pymupdf",
+        word_counter: str = "regex"
+    ) -> list[PageText]:
+        """
+        Extract text from PDF pages.
+        backend is one of TEXT_BACKENDS; uninstalled backends fall back to pdfplumber.
+        word_counter is one of WORD_COUNTERS.
+        """
+        if max_workers is None:
+            max_workers = default_max_workers()
+        
+        text_data = [
+            self._build_page_text(page_num, text)
+            for page_num, text, _ in self._scan_pages(
+                pages, False, max_workers, backend, default_executor()
+            )
+        ]
+        
+        if word_counter == "plumber_words":
+            self._apply_plumber_word_counts(text_data, pages)
         
-        return text_results
+        return text_data
+    
+    def _build_page_text(self, page_num: int, text: str) -> PageText:
+        """Build the per-page text record."""
+        return PageText(
+            page_number=page_num,
+            text=text,
+            char_count=len(text),
+            # Count matches lazily instead of materializing every word with split()
+            word_count=sum(1 for _ in _WORD_RE.finditer(text)) if text else 0
+        )
+    
+    def _apply_plumber_word_counts(
+        self,
+        text_data: list[PageText],
+        pages: Optional[list[int]] = None
+    ) -> int:
+        """
+        Replace the regex word counts with pdfplumber's extract_words() counts.
+        Returns the new total.
+        """
+        counts = {}
+        for page_num, page in self._iter_pages(pages):
+            try:
+                counts[page_num] = len(page.extract_words())
+            finally:
+                page.close()
+        
+        total = 0
+        for i, page_text in enumerate(text_data):
+            word_count = counts.get(page_text.page_number, page_text.word_count)
+            if word_count != page_text.word_count:
+                text_data[i] = page_text.model_copy(update={"word_count": word_count})
+            total += word_count
+        
+        return total
     
     def extract_tables(
         self, 
         pages: Optional[list[int]] = None,
-        output_format: str = "json"
+        output_format: str = "json",
+        max_workers: Optional[int] = None,
+        force_pattern_tables: bool = False
     ) -> list[TableData]:
         """
         Extract tables using multiple strategies:
         1. Standard pdfplumber detection (for bordered tables)
-        2. Pattern-based extraction (for borderless tables in academic papers)
+        2. Pattern-based extraction (for borderless tables in academic papers),
+           only when no bordered table was found or force_pattern_tables is set
+        """
+        return list(self.extract_tables_iter(pages, output_format, max_workers, force_pattern_tables))
+    
+    def extract_tables_iter(
+        self,
+        pages: Optional[list[int]] = None,
+        output_format: str = "json",
+        max_workers: Optional[int] = None,
+        force_pattern_tables: bool = False
+    ) -> Iterator[TableData]:
+        """
+        Yield tables as they are found, so callers can write them out
+        incrementally. Bordered tables are yielded page by page; pattern-based
+        tables follow once the text of every selected page is known, if no
+        bordered table was found or force_pattern_tables is set.
         """
+        if max_workers is None:
+            max_workers = default_max_workers()
+        
+        text_parts = []
+        seen_sigs = set()
+        
+        # Strategy 1: Standard table detection
+        for _, text, page_tables in self._iter_scan_pages(
+            pages, True, max_workers, executor=default_executor()
+        ):
+            # Keep page text for pattern-based extraction
+            text_parts.append(text)
+            for table in page_tables:
+                seen_sigs.add(self._table_signature(table))
+                yield table
+        
+        # Strategy 2: Pattern-based extraction for borderless tables
+        if not seen_sigs or force_pattern_tables:
+            yield from self._iter_pattern_tables("\n\n".join(text_parts), seen_sigs)
+    
+    def _extract_bordered_tables(self, page, page_num: int) -> list[TableData]:
+        """Run standard pdfplumber detection (bordered tables) on a single page."""
         tables_results = []
+        clean_cell = self._clean_cell
         
-        with pdfplumber.open(self.file_path) as pdf:
-            # Get full text for pattern-based extraction
-            full_text = ""
-            for page in pdf.pages:
-                full_text += (page.extract_text() or "") + "\n\n"
-            
-            # Strategy 1: Standard table detection
-            for i, page in enumerate(pdf.pages):
-                page_num = i + 1
-                
-                if pages and page_num not in pages:
-                    continue
-                
-                # Try standard extraction
-                try:
-                    page_tables = page.extract_tables()
-                    for table in page_tables:
-                        if self._is_valid_bordered_table(table):
-                            headers = None
-                            data_rows = table
-                            
-                            if self._looks_like_header(table[0]):
-                                headers = [self._clean_cell(c) for c in table[0]]
-                                data_rows = table[1:]
-                            
-                            cleaned_rows = [
-                                [self._clean_cell(c) for c in row]
-                                for row in data_rows
-                                if any(str(c).strip() for c in row if c)
-                            ]
-                            
-                            if cleaned_rows:
-                                tables_results.append(TableData(
-                                    page_number=page_num,
-                                    table_index=len(tables_results),
-                                    headers=headers,
-                                    rows=cleaned_rows,
-                                    row_count=len(cleaned_rows),
-                                    column_count=len(table[0]) if table else 0
-                                ))
-                except Exception:
-                    pass
-            
-            # Strategy 2: Pattern-based extraction for borderless tables
-            pattern_tables = self._extract_pattern_tables(full_text)
-            
-            for pt in pattern_tables:
-                # Avoid duplicates
-                is_dup = False
-                for existing in tables_results:
-                    if self._tables_overlap(pt, existing):
-                        is_dup = True
-                        break
-                
-                if not is_dup:
-                    tables_results.append(pt)
+        try:
+            page_tables = page.extract_tables()
+            for table in page_tables:
+                if self._is_valid_bordered_table(table):
+                    first_row = table[0]
+                    headers = None
+                    data_rows = table
+                    
+                    if self._looks_like_header(first_row):
+                        headers = list(map(clean_cell, first_row))
+                        data_rows = table[1:]
+                    
+                    # Clean each row once and drop it if every cleaned cell is empty
+                    cleaned_rows = []
+                    for row in data_rows:
+                        cleaned = list(map(clean_cell, row))
+                        if any(cleaned):
+                            cleaned_rows.append(cleaned)
+                    
+                    if cleaned_rows:
+                        tables_results.append(TableData(
+                            page_number=page_num,
+                            table_index=len(tables_results),
+                            headers=headers,
+                            rows=cleaned_rows,
+                            row_count=len(cleaned_rows),
+                            column_count=len(first_row),
+                            first_row_sig=self._row_signature(cleaned_rows[0])
+                        ))
+        except Exception:
+            pass
         
         return tables_results
     
+    def _merge_pattern_tables(self, tables_results: list[TableData], full_text: str) -> list[TableData]:
+        """Append pattern-based (borderless) tables that don't duplicate bordered ones."""
+        seen_sigs = {self._table_signature(t) for t in tables_results}
+        tables_results.extend(list(self._iter_pattern_tables(full_text, seen_sigs)))
+        return tables_results
+    
+    def _iter_pattern_tables(self, full_text: str, seen_sigs: set[str]) -> Iterator[TableData]:
+        """
+        Yield pattern-based (borderless) tables whose first row doesn't duplicate
+        a table already emitted. seen_sigs holds the emitted tables' signatures
+        and is updated in place.
+        """
+        for pt in self._extract_pattern_tables(full_text):
+            sig = self._table_signature(pt)
+            
+            # Avoid duplicates: identical first rows are caught by the set lookup,
+            # partial (substring) matches still need the pairwise comparison
+            if sig in seen_sigs and sig:
+                continue
+            if any(self._signatures_overlap(sig, seen) for seen in seen_sigs):
+                continue
+            
+            seen_sigs.add(sig)
+            yield pt
+    
     def _extract_pattern_tables(self, full_text: str) -> list[TableData]:
         """Extract tables using regex patterns for common academic paper formats."""
         tables = []
@@ -190,23 +682,16 @@ class PDFExtractor:
         
         # Pattern 1: Data with label + multiple decimal numbers (P R F1 scores)
         # Example: P1411 0.99 1 1
-        label_score_pattern = re.compile(
-            r'^([A-Za-z]\d+|[A-Za-z_]+avg)\s+([\d\.]+)\s+([\d\.]+)\s+([\d\.]+)\s*$',
-            re.MULTILINE
-        )
-        matches = label_score_pattern.findall(full_text)
+        matches = _LABEL_SCORE_RE.findall(full_text)
         
         if matches:
-            rows = []
-            for m in matches:
-                try:
-                    # Validate numbers
-                    float(m[1])
-                    float(m[2])
-                    float(m[3])
-                    rows.append([m[0], m[1], m[2], m[3]])
-                except:
-                    pass
+            # Validate numbers: the groups are runs of digits and dots, which
+            # _NUM_RE accepts exactly when float() would
+            rows = [
+                [m[0], m[1], m[2], m[3]]
+                for m in matches
+                if _NUM_RE.match(m[1]) and _NUM_RE.match(m[2]) and _NUM_RE.match(m[3])
+            ]
             
             if len(rows) >= 3:
                 tables.append(TableData(
@@ -215,16 +700,13 @@ class PDFExtractor:
                     headers=['Label', 'P', 'R', 'F1'],
                     rows=rows,
                     row_count=len(rows),
-                    column_count=4
+                    column_count=4,
+                    first_row_sig=self._row_signature(rows[0])
                 ))
                 table_idx += 1
         
         # Pattern 2: Feature combination results (F1, F2, F3, F4 + Train/Test)
-        feature_pattern = re.compile(
-            r'(F[1-4])\s*(Train|Test)\s*([\d\.]+)\s*([\d\.]+)\s*([\d\.]+)',
-            re.MULTILINE
-        )
-        feature_matches = feature_pattern.findall(full_text)
+        feature_matches = _FEATURE_RE.findall(full_text)
         
         if feature_matches and len(feature_matches) >= 2:
             rows = [[m[0], m[1], m[2], m[3], m[4]] for m in feature_matches]
@@ -234,17 +716,14 @@ class PDFExtractor:
                 headers=['Feature', 'Dataset', 'P', 'R', 'F1'],
                 rows=rows,
                 row_count=len(rows),
-                column_count=5
+                column_count=5,
+                first_row_sig=self._row_signature(rows[0])
             ))
             table_idx += 1
         
         # Pattern 3: Model comparison (SVM, BERT, ERNIE)
         # Look for lines with just model name + 3 numbers
-        model_pattern = re.compile(
-            r'^(SVM|BERT|ERNIE(?:\([^)]+\))?)\s+([\d\.]+)\s+([\d\.]+)\s+([\d\.]+)\s*$',
-            re.MULTILINE
-        )
-        model_matches = model_pattern.findall(full_text)
+        model_matches = _MODEL_RE.findall(full_text)
         
         if model_matches and len(model_matches) >= 2:
             rows = [[m[0], m[1], m[2], m[3]] for m in model_matches]
@@ -254,17 +733,14 @@ class PDFExtractor:
                 headers=['Model', 'Precision', 'Recall', 'F1-score'],
                 rows=rows,
                 row_count=len(rows),
-                column_count=4
+                column_count=4,
+                first_row_sig=self._row_signature(rows[0])
             ))
             table_idx += 1
         
         # Pattern 4: Key-value pairs (like hyperparameters)
         # Example: C Parameter 0.1, 1.0
-        kv_pattern = re.compile(
-            r'^(\d+)\s+([A-Za-z]+(?:\s+[A-Za-z]+)?)\s+(.+)$',
-            re.MULTILINE
-        )
-        kv_matches = kv_pattern.findall(full_text)
+        kv_matches = _KV_RE.findall(full_text)
         
         if kv_matches and len(kv_matches) >= 2:
             rows = [[m[0], m[1], m[2]] for m in kv_matches[:10]]
@@ -274,7 +750,8 @@ class PDFExtractor:
                 headers=['No', 'Parameter', 'Value'],
                 rows=rows,
                 row_count=len(rows),
-                column_count=3
+                column_count=3,
+                first_row_sig=self._row_signature(rows[0])
             ))
             table_idx += 1
         
@@ -290,15 +767,22 @@ class PDFExtractor:
         
         col_count = len(table[0])
         
-        # Analyze content
+        # Analyze content in one pass, measuring each cell once;
+        # empty cells count towards the total but are neither long nor short
         total_cells = 0
         long_cells = 0
+        short_cells = 0
         
         for row in table:
+            total_cells += len(row)
             for cell in row:
-                total_cells += 1
-                if cell and len(str(cell)) > 100:
+                if not cell:
+                    continue
+                length = len(cell if type(cell) is str else str(cell))
+                if length > 100:
                     long_cells += 1
+                elif length < 50:
+                    short_cells += 1
         
         if total_cells == 0:
             return False
@@ -307,36 +791,42 @@ class PDFExtractor:
         if long_cells / total_cells > 0.25:
             return False
         
-        # For 2-column tables, be extra strict
-        if col_count == 2:
-            # Most cells should be short
-            short_cells = sum(1 for row in table for c in row if c and len(str(c)) < 50)
-            if short_cells / total_cells < 0.7:
-                return False
+        # For 2-column tables, be extra strict: most cells should be short
+        if col_count == 2 and short_cells / total_cells < 0.7:
+            return False
         
         return True
     
-    def _tables_overlap(self, table1: TableData, table2: TableData) -> bool:
-        """Check if two tables have overlapping content."""
-        if not table1.rows or not table2.rows:
-            return False
-        
-        # Compare first row content
-        t1_first = ' '.join(str(c) for c in table1.rows[0] if c).lower()[:50]
-        t2_first = ' '.join(str(c) for c in table2.rows[0] if c).lower()[:50]
-        
-        if t1_first and t2_first:
-            if t1_first in t2_first or t2_first in t1_first:
+    def _signatures_overlap(self, sig1: str, sig2: str) -> bool:
+        """Check if two first-row signatures contain one another."""
+        if sig1 and sig2:
+            if sig1 in sig2 or sig2 in sig1:
                 return True
         
         return False
     
+    def _table_signature(self, table: TableData) -> str:
+        """Normalized first-row text used to spot duplicate tables."""
+        # Tables built here carry it precomputed; others are signed on the fly
+        if table.first_row_sig is not None:
+            return table.first_row_sig
+        if not table.rows:
+            return ""
+        return self._row_signature(table.rows[0])
+    
+    def _row_signature(self, row: list) -> str:
+        """Lowercased text of a row's non-empty cells, truncated to 50 characters."""
+        return ' '.join(str(c) for c in row if c).lower()[:50]
+    
     def _clean_cell(self, cell) -> str:
         """Clean a table cell value."""
         if cell is None:
             return ""
-        text = str(cell)
-        text = re.sub(r'\s+', ' ', text)
+        # pdfplumber cells are almost always str already; skip the str() call then
+        text = cell if type(cell) is str else str(cell)
+        if not text:
+            return text
+        text = _WS_RE.sub(' ', text)
         return text.strip()
     
     def _looks_like_header(self, row: list) -> bool:
@@ -344,49 +834,73 @@ class PDFExtractor:
         if not row:
             return False
         
-        non_empty = sum(1 for cell in row if cell and str(cell).strip())
-        if non_empty < len(row) * 0.5:
-            return False
-        
+        half = len(row) * 0.5
+        non_empty = 0
         numeric_count = 0
-        for cell in row:
-            if cell:
-                try:
-                    clean = str(cell).replace(",", "").replace("$", "").replace("%", "").strip()
-                    if clean and clean not in ['-', '–', '—', ''] and len(clean) < 20:
-                        float(clean)
-                        numeric_count += 1
-                except ValueError:
-                    pass
-        
-        return numeric_count < len(row) * 0.5
-    
-    def extract_image_info(self, pages: Optional[list[int]] = None) -> list[ImageInfo]:
-        """Extract image information from PDF."""
-        images_info = []
-        reader = PdfReader(self.file_path)
         
-        for i, page in enumerate(reader.pages):
-            page_num = i + 1
+        for cell in row:
+            if not cell:
+                continue
             
-            if pages and page_num not in pages:
+            text = (cell if type(cell) is str else str(cell)).strip()
+            if not text:
                 continue
             
+            non_empty += 1
+            clean = text.translate(_NUM_STRIP).strip()
+            if len(clean) < 20 and _NUM_RE.match(clean):
+                numeric_count += 1
+                # A mostly numeric row is data, whatever the remaining cells hold
+                if numeric_count >= half:
+                    return False
+        
+        return non_empty >= half
+    
+    def extract_image_info(
+        self,
+        pages: Optional[list[int]] = None,
+        backend: str = "pymupdf"
+    ) -> list[ImageInfo]:
+        """
+        Extract image information from PDF.
+        Uses PyMuPDF when backend is "pymupdf" and it is installed, otherwise pypdf.
+        """
+        if backend == "pymupdf" and pymupdf is not None:
+            return self._extract_image_info_pymupdf(pages)
+        
+        from pypdf.generic import IndirectObject
+        
+        images_info = []
+        reader_pages = self._reader.pages
+        # Image fields by (idnum, generation) of the XObject, or None for non-images,
+        # so an image shared by many pages (logos, watermarks) is resolved once
+        resolved: dict[tuple[int, int], Optional[dict]] = {}
+        
+        # Only touch the requested pages; resolving /Resources parses the page
+        for page_num in self._select_pages(len(reader_pages), pages):
+            page = reader_pages[page_num - 1]
+            
             try:
                 if "/Resources" in page and "/XObject" in page["/Resources"]:
                     x_objects = page["/Resources"]["/XObject"].get_object()
                     
                     img_index = 0
                     for obj_name in x_objects:
-                        obj = x_objects[obj_name]
-                        if obj.get("/Subtype") == "/Image":
+                        ref = x_objects.raw_get(obj_name)
+                        key = (ref.idnum, ref.generation) if isinstance(ref, IndirectObject) else None
+                        
+                        if key is not None and key in resolved:
+                            fields = resolved[key]
+                        else:
+                            fields = self._image_fields(x_objects[obj_name])
+                            if key is not None:
+                                resolved[key] = fields
+                        
+                        if fields is not None:
                             images_info.append(ImageInfo(
                                 page_number=page_num,
                                 image_index=img_index,
-                                width=int(obj.get("/Width", 0)),
-                                height=int(obj.get("/Height", 0)),
-                                color_space=str(obj.get("/ColorSpace", "")),
-                                bits_per_component=int(obj.get("/BitsPerComponent", 0)) if obj.get("/BitsPerComponent") else None
+                                **fields
                             ))
                             img_index += 1
             except Exception:
@@ -394,27 +908,84 @@ class PDFExtractor:
         
         return images_info
     
+    def _extract_image_info_pymupdf(self, pages: Optional[list[int]] = None) -> list[ImageInfo]:
+        """Extract image information with PyMuPDF, which reports image fields without resolving XObjects."""
+        images_info = []
+        doc = self._mupdf
+        
+        for page_num in self._select_pages(doc.page_count, pages):
+            img_index = 0
+            # (xref, smask, width, height, bpc, colorspace, alt_colorspace, name, filter, referencer)
+            for img in doc.load_page(page_num - 1).get_images(full=True):
+                # A non-zero referencer is a Form XObject; pypdf only sees the page's own images
+                if img[9]:
+                    continue
+                
+                images_info.append(ImageInfo(
+                    page_number=page_num,
+                    image_index=img_index,
+                    width=img[2],
+                    height=img[3],
+                    # Keep pypdf's name form, e.g. "/DeviceRGB"
+                    color_space="/" + img[5] if img[5] else "",
+                    bits_per_component=img[4] or None
+                ))
+                img_index += 1
+        
+        return images_info
+    
+    def _image_fields(self, obj) -> Optional[dict]:
+        """ImageInfo fields of an image XObject, or None for other XObjects."""
+        if obj.get("/Subtype") != "/Image":
+            return None
+        
+        return {
+            "width": int(obj.get("/Width", 0)),
+            "height": int(obj.get("/Height", 0)),
+            "color_space": str(obj.get("/ColorSpace", "")),
+            "bits_per_component": int(obj.get("/BitsPerComponent", 0)) if obj.get("/BitsPerComponent") else None,
+        }
+    
     def _parse_pdf_date(self, date_str: str) -> Optional[str]:
         """Parse PDF date format to ISO format."""
         try:
             if date_str.startswith("D:"):
                 date_str = date_str[2:]
             date_str = date_str.replace("'", "").replace("Z", "")
+            # Fixed YYYYMMDD[HHmmSS] layout: slice the fields instead of going through strptime
             if len(date_str) >= 14:
-                dt = datetime.strptime(date_str[:14], "%Y%m%d%H%M%S")
-                return dt.isoformat()
+                digits = date_str[:14]
             elif len(date_str) >= 8:
-                dt = datetime.strptime(date_str[:8], "%Y%m%d")
-                return dt.isoformat()
+                digits = date_str[:8] + "000000"
+            else:
+                return None
+            
+            if not (digits.isascii() and digits.isdigit()):
+                return None
+            
+            return datetime(
+                int(digits[0:4]), int(digits[4:6]), int(digits[6:8]),
+                int(digits[8:10]), int(digits[10:12]), int(digits[12:14])
+            ).isoformat()
         except Exception:
             pass
         return None
     
-    def _compute_statistics(self, response: ExtractionResponse) -> dict:
-        """Compute extraction statistics."""
+    def _compute_statistics(
+        self,
+        response: ExtractionResponse,
+        text_stats: Optional[dict] = None
+    ) -> dict:
+        """
+        Compute extraction statistics.
+        text_stats carries text totals already accumulated during extraction,
+        so the page list doesn't have to be scanned again.
+        """
         stats = {"extraction_timestamp": response.extraction_timestamp}
         
-        if response.text:
+        if text_stats:
+            stats.update(text_stats)
+        elif response.text:
             stats["total_pages_extracted"] = len(response.text)
             stats["total_characters"] = sum(p.char_count for p in response.text)
             stats["total_words"] = sum(p.word_count for p in response.text)
@@ -432,19 +1003,54 @@ class PDFExtractor:
         return stats
 
 
+def _scan_page_chunk(
+    file_path: str,
+    page_nums: list[int],
+    extract_tables: bool,
+    cached_texts: Optional[dict[int, str]] = None
+) -> list[tuple[int, str, list[TableData]]]:
+    """
+    Worker: open a private pdfplumber handle for a chunk of pages and scan them.
+    cached_texts holds page text the caller already has, which isn't extracted again.
+    Defined at module level so it can be sent to a process pool.
+    """
+    import pdfplumber
+    
+    extractor = PDFExtractor(file_path, file_size=0)
+    if cached_texts:
+        extractor._page_text_cache.update(cached_texts)
+    with pdfplumber.open(file_path, pages=page_nums) as pdf:
+        return [
+            extractor._scan_page(page, page.page_number, extract_tables)
+            for page in pdf.pages
+        ]
+
+
 class TableExporter:
     """Export tables to different formats."""
     
     @staticmethod
-    def to_dataframe(table: TableData) -> pd.DataFrame:
+    def _columns(table: TableData) -> list:
+        """Column labels; headerless tables get positional labels like pandas does."""
+        if table.headers:
+            return table.headers
+        return list(range(max((len(row) for row in table.rows), default=0)))
+    
+    @staticmethod
+    def to_dataframe(table: TableData) -> "pd.DataFrame":
+        import pandas as pd
+        
         if table.headers:
             return pd.DataFrame(table.rows, columns=table.headers)
         return pd.DataFrame(table.rows)
     
     @staticmethod
     def to_csv(table: TableData) -> str:
-        df = TableExporter.to_dataframe(table)
-        return df.to_csv(index=False)
+        buf = io.StringIO()
+        writer = csv.writer(buf, lineterminator="\n")
+        writer.writerow(TableExporter._columns(table))
+        writer.writerows(table.rows)
+        return buf.getvalue()
     
     @staticmethod
     def to_markdown(table: TableData) -> str:
@@ -452,6 +1058,7 @@ class TableExporter:
         return df.to_markdown(index=False)
     
     @staticmethod
-    def to_dict(table: TableData) -> dict:
-        df = TableExporter.to_dataframe(table)
-        return df.to_dict(orient='records')
+    def to_dict(table: TableData) -> list[dict]:
+        # Headerless tables get string keys, so records survive a JSON round-trip unchanged
+        columns = table.headers or [f"col_{i}" for i in TableExporter._columns(table)]
+        return [dict(zip(columns, row)) for row in table.rows]